@@ -11,10 +11,203 @@ This script validates code against organizational SDLC standards including:
 
 import os
 import sys
-import re
 import ast
-from pathlib import Path
-from typing import List, Tuple, Dict
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+
+# Directories that are pruned from the walk along with their whole subtree
+_EXCLUDE = frozenset({
+    'venv', '.venv', 'env', '__pycache__', '.git',
+    '.tox', 'node_modules', 'build', 'dist',
+})
+
+# Projects with at most this many files are checked in-process
+_PARALLEL_THRESHOLD = 8
+
+
+def _is_snake(name: str, allow_leading_underscore: bool = False) -> bool:
+    """Return True if name is ASCII snake_case ([a-z][a-z0-9_]*)."""
+    # isidentifier() guarantees [A-Za-z_][A-Za-z0-9_]* for ASCII names
+    if not (name.isascii() and name.isidentifier()) or name != name.lower():
+        return False
+    return allow_leading_underscore or name[0] != '_'
+
+
+def _is_pascal(name: str) -> bool:
+    """Return True if name is ASCII PascalCase ([A-Z][a-zA-Z0-9]*)."""
+    return name.isascii() and name[:1].isupper() and name.isalnum()
+
+
+def _scandir(path: str) -> List['os.DirEntry[str]']:
+    """List a directory's entries, treating unreadable directories as empty."""
+    # Like pathlib.rglob, skip directories that vanish or cannot be read
+    try:
+        with os.scandir(path) as entries:
+            return list(entries)
+    except OSError:
+        return []
+
+
+def _scandir_recursive(path: str) -> Iterator['os.DirEntry[str]']:
+    """Yield DirEntry objects for all Python files below path, pruning excluded dirs."""
+    for entry in _scandir(path):
+        if entry.name in _EXCLUDE:
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scandir_recursive(entry.path)
+        elif entry.is_file(follow_symlinks=False) and entry.name.endswith('.py'):
+            yield entry
+
+
+def _scandir_dirs(path: str) -> Iterator[str]:
+    """Yield the paths of all subdirectories below path, pruning excluded dirs."""
+    for entry in _scandir(path):
+        if entry.name not in _EXCLUDE and entry.is_dir(follow_symlinks=False):
+            yield entry.path
+            yield from _scandir_dirs(entry.path)
+
+
+def _load(py_file: str) -> Tuple[int, ast.Module]:
+    """Read a source file once and return its line count and AST."""
+    # ast.parse decodes bytes itself, honouring any BOM or coding cookie
+    with open(py_file, 'rb') as f:
+        content = f.read()
+    line_count = content.count(b'\n') + (0 if content.endswith(b'\n') else 1)
+    return line_count, ast.parse(content, filename=py_file)
+
+
+# Statement-list fields of compound statements (if/for/try/with/match, defs),
+# in source order
+_BLOCK_FIELDS = ('body', 'handlers', 'orelse', 'finalbody', 'cases')
+
+# Definitions subject to the naming, docstring and length checks
+_Definition = Union[ast.FunctionDef, ast.ClassDef]
+
+# Statements that open a new scope; wildcard imports cannot appear inside them
+_SCOPE_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def _iter_statements(body: List[ast.stmt], enter_scopes: bool) -> Iterator[ast.AST]:
+    """Yield the statements in body and its nested blocks, never expressions.
+    
+    Function and class bodies are only entered when enter_scopes is True.
+    """
+    pending: List[ast.AST] = list(reversed(body))
+    while pending:
+        node = pending.pop()
+        yield node
+        if enter_scopes or not isinstance(node, _SCOPE_NODES):
+            for field in reversed(_BLOCK_FIELDS):
+                pending.extend(reversed(getattr(node, field, ())))
+
+
+def _check_file(py_file: str) -> Tuple[List[str], List[str]]:
+    """Run all AST-based checks on one file and return its errors and warnings."""
+    errors: List[str] = []
+    warnings: List[str] = []
+    try:
+        line_count, tree = _load(py_file)
+    except Exception as e:
+        warnings.append(f"Could not parse '{py_file}': {e}")
+        return errors, warnings
+    
+    # Collect the definitions every check needs in a single pass
+    definitions: List[_Definition] = [
+        node for node in _iter_statements(tree.body, enter_scopes=True)
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef))
+    ]
+    
+    _check_names(definitions, py_file, errors)
+    _check_docstrings(tree, definitions, py_file, errors, warnings)
+    _check_complexity(definitions, line_count, py_file, warnings)
+    _check_imports(tree, py_file, errors)
+    return errors, warnings
+
+
+def _check_names(definitions: List[_Definition], py_file: str,
+                 errors: List[str]) -> None:
+    """Check that functions and classes follow naming conventions."""
+    errors_append = errors.append
+    for node in definitions:
+        if isinstance(node, ast.FunctionDef):
+            # Check function names are snake_case
+            if not _is_snake(node.name, allow_leading_underscore=True):
+                errors_append(
+                    f"Function '{node.name}' in '{py_file}' "
+                    f"does not follow snake_case convention"
+                )
+        
+        else:
+            # Check class names are PascalCase
+            if not _is_pascal(node.name):
+                errors_append(
+                    f"Class '{node.name}' in '{py_file}' "
+                    f"does not follow PascalCase convention"
+                )
+
+
+def _check_docstrings(tree: ast.Module, definitions: List[_Definition], py_file: str,
+                      errors: List[str], warnings: List[str]) -> None:
+    """Check that all public functions and classes have docstrings."""
+    # Check module docstring
+    if not ast.get_docstring(tree):
+        warnings.append(f"Module '{py_file}' missing docstring")
+    
+    errors_append = errors.append
+    for node in definitions:
+        # Skip private methods
+        if node.name.startswith('_') and not node.name.startswith('__'):
+            continue
+        
+        if not ast.get_docstring(node):
+            node_type = "Function" if isinstance(node, ast.FunctionDef) else "Class"
+            errors_append(
+                f"{node_type} '{node.name}' in '{py_file}' missing docstring"
+            )
+
+
+def _check_complexity(definitions: List[_Definition], line_count: int, py_file: str,
+                      warnings: List[str]) -> None:
+    """Check code complexity metrics."""
+    max_function_lines = 50
+    max_file_lines = 500
+    
+    # Check file length
+    if line_count > max_file_lines:
+        warnings.append(
+            f"File '{py_file}' has {line_count} lines "
+            f"(exceeds recommended {max_file_lines})"
+        )
+    
+    # Check function length
+    warnings_append = warnings.append
+    for node in definitions:
+        if isinstance(node, ast.FunctionDef):
+            # end_lineno is Optional in the AST types but always set by ast.parse
+            func_lines = (node.end_lineno or node.lineno) - node.lineno + 1
+            if func_lines > max_function_lines:
+                warnings_append(
+                    f"Function '{node.name}' in '{py_file}' "
+                    f"has {func_lines} lines (exceeds recommended {max_function_lines})"
+                )
+
+
+def _check_imports(tree: ast.Module, py_file: str, errors: List[str]) -> None:
+    """Check import organization and style."""
+    # Wildcard imports are only legal at module level, so scan the module's
+    # statements (including if/try blocks) without entering defs or classes
+    errors_append = errors.append
+    for node in _iter_statements(tree.body, enter_scopes=False):
+        if isinstance(node, ast.ImportFrom) and any(
+            alias.name == '*' for alias in node.names
+        ):
+            errors_append(
+                f"Wildcard import found in '{py_file}': "
+                f"from {node.module} import *"
+            )
 
 
 class SDLCChecker:
@@ -22,195 +215,93 @@ class SDLCChecker:
     
     def __init__(self, root_path: str = "."):
         """Initialize the checker with the project root path."""
-        self.root_path = Path(root_path)
+        self.root_path = os.fspath(root_path)
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        self._py_files: Optional[List['os.DirEntry[str]']] = None
         
+    def _python_files(self) -> List['os.DirEntry[str]']:
+        """Return the project's Python files, walking the tree only once."""
+        if self._py_files is None:
+            self._py_files = list(_scandir_recursive(self.root_path))
+        return self._py_files
+    
     def check_all(self) -> Tuple[List[str], List[str]]:
         """Run all SDLC checks and return errors and warnings."""
+        # Drop any cached file list so each run sees the current tree
+        self._py_files = None
         self.check_file_naming()
         self.check_module_structure()
-        self.check_function_naming()
-        self.check_docstrings()
-        self.check_complexity()
-        self.check_imports()
+        self.check_source_files()
         
         return self.errors, self.warnings
     
     def check_file_naming(self) -> None:
         """Check that Python files follow naming conventions."""
-        for py_file in self.root_path.rglob("*.py"):
-            # Skip virtual environment and other common directories
-            if any(part in py_file.parts for part in ['venv', '.venv', 'env', '__pycache__', '.git']):
+        errors_append = self.errors.append
+        warnings_append = self.warnings.append
+        for entry in self._python_files():
+            py_file = entry.path
+            filename = entry.name[:-3]
+            
+            # Skip __init__ files
+            if filename == "__init__":
                 continue
-            if py_file.is_file():
-                filename = py_file.stem
-                
-                # Skip __init__ files
-                if filename == "__init__":
-                    continue
-                
-                # Check for snake_case
-                if not re.match(r'^[a-z][a-z0-9_]*$', filename):
-                    self.errors.append(
-                        f"File '{py_file}' does not follow snake_case naming convention"
-                    )
-                
-                # Check for no leading underscores (except for private modules)
-                if filename.startswith('_') and not filename.startswith('__'):
-                    self.warnings.append(
-                        f"File '{py_file}' starts with underscore (consider making it public)"
-                    )
+            
+            # Check for snake_case
+            if not _is_snake(filename):
+                errors_append(
+                    f"File '{py_file}' does not follow snake_case naming convention"
+                )
+            
+            # Check for no leading underscores (except for private modules)
+            if filename.startswith('_') and not filename.startswith('__'):
+                warnings_append(
+                    f"File '{py_file}' starts with underscore (consider making it public)"
+                )
     
     def check_module_structure(self) -> None:
         """Check that modules have proper structure."""
-        src_path = self.root_path / "src"
-        if not src_path.exists():
+        src_path = os.path.join(self.root_path, "src")
+        if not os.path.exists(src_path):
             self.errors.append("Missing 'src' directory for source code")
             return
         
         # Check for __init__.py files
-        for dir_path in src_path.rglob("**/"):
-            if dir_path.is_dir() and dir_path != src_path:
-                init_file = dir_path / "__init__.py"
-                if not init_file.exists():
-                    self.warnings.append(
-                        f"Directory '{dir_path}' missing __init__.py file"
-                    )
-    
-    def check_function_naming(self) -> None:
-        """Check that functions and classes follow naming conventions."""
-        for py_file in self.root_path.rglob("*.py"):
-            # Skip virtual environment and other common directories
-            if any(part in py_file.parts for part in ['venv', '.venv', 'env', '__pycache__', '.git']):
-                continue
-            if not py_file.is_file():
-                continue
-                
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    tree = ast.parse(f.read())
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        # Check function names are snake_case
-                        if not re.match(r'^[a-z_][a-z0-9_]*$', node.name):
-                            self.errors.append(
-                                f"Function '{node.name}' in '{py_file}' "
-                                f"does not follow snake_case convention"
-                            )
-                    
-                    elif isinstance(node, ast.ClassDef):
-                        # Check class names are PascalCase
-                        if not re.match(r'^[A-Z][a-zA-Z0-9]*$', node.name):
-                            self.errors.append(
-                                f"Class '{node.name}' in '{py_file}' "
-                                f"does not follow PascalCase convention"
-                            )
-            
-            except Exception as e:
-                self.warnings.append(f"Could not parse '{py_file}': {e}")
-    
-    def check_docstrings(self) -> None:
-        """Check that all public functions and classes have docstrings."""
-        for py_file in self.root_path.rglob("*.py"):
-            # Skip virtual environment and other common directories
-            if any(part in py_file.parts for part in ['venv', '.venv', 'env', '__pycache__', '.git']):
-                continue
-            if not py_file.is_file():
-                continue
-                
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    tree = ast.parse(f.read())
-                
-                # Check module docstring
-                if not ast.get_docstring(tree):
-                    self.warnings.append(f"Module '{py_file}' missing docstring")
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-                        # Skip private methods
-                        if node.name.startswith('_') and not node.name.startswith('__'):
-                            continue
-                        
-                        if not ast.get_docstring(node):
-                            node_type = "Function" if isinstance(node, ast.FunctionDef) else "Class"
-                            self.errors.append(
-                                f"{node_type} '{node.name}' in '{py_file}' missing docstring"
-                            )
-            
-            except Exception as e:
-                self.warnings.append(f"Could not parse '{py_file}': {e}")
+        warnings_append = self.warnings.append
+        for dir_path in _scandir_dirs(src_path):
+            if not os.path.exists(os.path.join(dir_path, "__init__.py")):
+                warnings_append(
+                    f"Directory '{dir_path}' missing __init__.py file"
+                )
     
-    def check_complexity(self) -> None:
-        """Check code complexity metrics."""
-        max_function_lines = 50
-        max_file_lines = 500
+    def check_source_files(self) -> None:
+        """Parse each Python file once and run all AST-based checks on it."""
+        files = [entry.path for entry in self._python_files()]
         
-        for py_file in self.root_path.rglob("*.py"):
-            # Skip virtual environment and other common directories
-            if any(part in py_file.parts for part in ['venv', '.venv', 'env', '__pycache__', '.git']):
-                continue
-            if not py_file.is_file():
-                continue
-            
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-                
-                # Check file length
-                if len(lines) > max_file_lines:
-                    self.warnings.append(
-                        f"File '{py_file}' has {len(lines)} lines "
-                        f"(exceeds recommended {max_file_lines})"
-                    )
-                
-                # Check function length
-                tree = ast.parse(content)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        func_lines = node.end_lineno - node.lineno + 1
-                        if func_lines > max_function_lines:
-                            self.warnings.append(
-                                f"Function '{node.name}' in '{py_file}' "
-                                f"has {func_lines} lines (exceeds recommended {max_function_lines})"
-                            )
-            
-            except Exception as e:
-                self.warnings.append(f"Could not analyze '{py_file}': {e}")
+        # Process startup outweighs the parsing work on small projects
+        if len(files) <= _PARALLEL_THRESHOLD:
+            self._collect(map(_check_file, files))
+            return
+        
+        # Never start more workers than files, and give each worker several
+        # chunks so uneven file sizes still balance across the pool
+        workers = min(os.cpu_count() or 1, len(files))
+        chunksize = max(1, len(files) // (workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_check_file, files, chunksize=chunksize))
+        except (pickle.PicklingError, BrokenProcessPool, OSError):
+            # Pools are unavailable in some sandboxes, or when this module was
+            # loaded in a way child processes cannot import; check in-process
+            results = list(map(_check_file, files))
+        self._collect(results)
     
-    def check_imports(self) -> None:
-        """Check import organization and style."""
-        for py_file in self.root_path.rglob("*.py"):
-            # Skip virtual environment and other common directories
-            if any(part in py_file.parts for part in ['venv', '.venv', 'env', '__pycache__', '.git']):
-                continue
-            if not py_file.is_file():
-                continue
-            
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    tree = ast.parse(f.read())
-                
-                imports = []
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.Import, ast.ImportFrom)):
-                        imports.append(node)
-                
-                # Check for wildcard imports
-                for imp in imports:
-                    if isinstance(imp, ast.ImportFrom):
-                        for alias in imp.names:
-                            if alias.name == '*':
-                                self.errors.append(
-                                    f"Wildcard import found in '{py_file}': "
-                                    f"from {imp.module} import *"
-                                )
-            
-            except Exception as e:
-                self.warnings.append(f"Could not check imports in '{py_file}': {e}")
+    def _collect(self, results: Iterable[Tuple[List[str], List[str]]]) -> None:
+        """Merge per-file (errors, warnings) results into the checker, in file order."""
+        for errors, warnings in results:
+            self.errors.extend(errors)
+            self.warnings.extend(warnings)
 
 
 def main():
@@ -5,15 +5,33 @@ This module demonstrates basic arithmetic operations for the CI/CD pipeline exam
 It follows SDLC naming conventions and includes comprehensive docstrings.
 """
 
-from typing import List, Union
+from collections import deque
+from typing import Any, Deque, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - NumPy is only needed for batch operations
+    HAS_NUMPY = False
 
 
 class Calculator:
     """A simple calculator class for basic arithmetic operations."""
 
-    def __init__(self) -> None:
-        """Initialize the calculator with a history of operations."""
-        self.history: List[str] = []
+    __slots__ = ("history", "last_result")
+
+    def __init__(self, max_history: Optional[int] = None) -> None:
+        """
+        Initialize the calculator with a history of operations.
+
+        Args:
+            max_history: Maximum number of operations to remember; the oldest
+                entries are discarded once it is reached. None means unbounded.
+        """
+        # Operations are stored as (operator, a, b, result), or as
+        # (operator, element_count) for batches, and formatted on demand
+        self.history: Deque[Tuple[Any, ...]] = deque(maxlen=max_history)
         self.last_result = 0
 
     def add(self, a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
@@ -28,12 +46,80 @@ class Calculator:
             Sum of a and b
         """
         result = a + b
-        self.history.append(f"{a} + {b} = {result}")
+        self.history.append(("+", a, b, result))
+        return result
+
+    def add_many(self, a: Any, b: Any) -> Any:
+        """
+        Add two sequences of numbers element-wise using NumPy.
+
+        The whole batch is recorded as a single history entry.
+
+        Args:
+            a: First array-like of numbers
+            b: Second array-like of numbers, broadcastable against a
+
+        Returns:
+            NumPy array of element-wise sums
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if not HAS_NUMPY:
+            raise ImportError("add_many requires NumPy to be installed")
+        a = np.asarray(a)
+        b = np.asarray(b)
+        result = np.add(a, b)
+        self._record_batch("+", result)
         return result
 
+    def add_many_jit(self, a: Any, b: Any) -> Any:
+        """
+        Add two 1-D sequences of numbers element-wise using a compiled kernel.
+
+        Uses the Numba kernel from calculator_fast when Numba is installed and
+        falls back to NumPy otherwise. The batch is recorded as one history entry.
+
+        Args:
+            a: First array-like of numbers
+            b: Second array-like of numbers, same length as a
+
+        Returns:
+            NumPy array of element-wise sums in the inputs' common numeric
+            dtype (integers stay exact; non-numeric inputs become float64)
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If the inputs are not 1-D arrays of equal length
+        """
+        if not HAS_NUMPY:
+            raise ImportError("add_many_jit requires NumPy to be installed")
+        # Imported lazily so NumPy/Numba are only needed by batch callers
+        from .calculator_fast import add_arrays
+
+        result = add_arrays(a, b)
+        self._record_batch("+", result)
+        return result
+
+    def _record_batch(self, op: str, result: Any) -> None:
+        """Record a batch operation by its size only, not its values."""
+        self.history.append((op, int(result.size)))
+
     def get_history(self) -> List[str]:
         """Get the history of all operations."""
-        return self.history.copy()
+        history = []
+        for entry in self.history:
+            if len(entry) == 2:
+                op, count = entry
+                history.append(f"{op} batch of {count} elements")
+            else:
+                op, a, b, result = entry
+                history.append(f"{a} {op} {b} = {result}")
+        return history
+
+    def clear_history(self) -> None:
+        """Forget all recorded operations."""
+        self.history.clear()
 
 
 def main() -> None:
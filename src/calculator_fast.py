@@ -0,0 +1,65 @@
+"""
+Fast Calculator Kernels
+
+This module provides compiled batch kernels for the Calculator class.
+Numba is optional: when it is installed the kernels are JIT-compiled (and cached
+on disk so compilation only happens once), otherwise NumPy ufuncs are used.
+"""
+
+from typing import Any, Callable
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _numpy_add_into(a: Any, b: Any, out: Any) -> None:
+    np.add(a, b, out=out)
+
+
+_add_into: Callable[[Any, Any, Any], None] = _numpy_add_into
+
+if HAS_NUMBA:  # pragma: no cover - Numba is an optional accelerator, absent in CI
+
+    @njit(cache=True)
+    def _numba_add_into(a: Any, b: Any, out: Any) -> None:
+        for i in range(a.shape[0]):
+            out[i] = a[i] + b[i]
+
+    _add_into = _numba_add_into
+
+
+def add_arrays(a: Any, b: Any) -> Any:
+    """
+    Add two one-dimensional arrays element-wise into a new array.
+
+    The result keeps the inputs' common numeric dtype, so integer inputs are
+    added exactly; non-numeric inputs are converted to float64.
+
+    Args:
+        a: First array-like of numbers
+        b: Second array-like of numbers, same length as a
+
+    Returns:
+        NumPy array of element-wise sums
+
+    Raises:
+        ValueError: If the inputs are not one-dimensional arrays of equal length
+    """
+    a = np.asarray(a)
+    b = np.asarray(b)
+    dtype = np.result_type(a, b)
+    if dtype.kind not in "biufc":
+        dtype = np.dtype(np.float64)
+    a = np.ascontiguousarray(a, dtype=dtype)
+    b = np.ascontiguousarray(b, dtype=dtype)
+    if a.ndim != 1 or a.shape != b.shape:
+        raise ValueError("add_arrays requires two 1-D arrays of equal length")
+    out = np.empty_like(a)
+    _add_into(a, b, out)
+    return out
@@ -4,6 +4,8 @@ Unit tests for the Calculator module.
 This test suite demonstrates a simple test for the CI/CD pipeline.
 """
 
+import pytest
+
 from src.calculator import Calculator, main
 
 
@@ -15,6 +17,87 @@ def test_simple_addition():
     assert calc.get_history() == ["2 + 3 = 5"]
 
 
+def test_history_is_bounded_and_clearable():
+    """Test that history keeps only the newest entries and can be cleared."""
+    calc = Calculator(max_history=2)
+    for i in range(3):
+        calc.add(i, 1)
+    assert calc.get_history() == ["1 + 1 = 2", "2 + 1 = 3"]
+    calc.clear_history()
+    assert calc.get_history() == []
+
+
+def test_add_many():
+    """Test that the calculator adds batches element-wise with one history entry."""
+    np = pytest.importorskip("numpy")
+    calc = Calculator()
+    result = calc.add_many([1, 2, 3], [4, 5, 6])
+    assert np.array_equal(result, [5, 7, 9])
+    assert calc.get_history() == ["+ batch of 3 elements"]
+
+
+def test_add_many_history_does_not_alias_inputs():
+    """Test that mutating batch inputs afterwards leaves history unchanged."""
+    np = pytest.importorskip("numpy")
+    calc = Calculator()
+    values = np.array([1, 2])
+    calc.add_many(values, values)
+    values[0] = 999
+    assert calc.get_history() == ["+ batch of 2 elements"]
+
+
+def test_add_many_jit():
+    """Test that the compiled batch path matches element-wise addition."""
+    np = pytest.importorskip("numpy")
+    calc = Calculator()
+    result = calc.add_many_jit([1.0, 2.5], [3.0, 4.5])
+    assert np.array_equal(result, [4.0, 7.0])
+    assert calc.get_history() == ["+ batch of 2 elements"]
+
+
+def test_add_many_jit_keeps_integers_exact():
+    """Test that integer batches are not rounded through float64."""
+    pytest.importorskip("numpy")
+    result = Calculator().add_many_jit([2**53], [1])
+    assert result.dtype.kind == "i"
+    assert result[0] == 2**53 + 1
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [([1.0, 2.0], [1.0]), ([[1.0, 2.0]], [[3.0, 4.0]])],
+    ids=["length-mismatch", "two-dimensional"],
+)
+def test_add_many_jit_rejects_invalid_shapes(a, b):
+    """Test that the compiled batch path only accepts equal-length 1-D inputs."""
+    pytest.importorskip("numpy")
+    calc = Calculator()
+    with pytest.raises(ValueError):
+        calc.add_many_jit(a, b)
+    assert calc.get_history() == []
+
+
+def test_numba_kernel_matches_numpy():
+    """Test that the Numba kernel agrees with np.add, including NaN and Inf."""
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+    from src import calculator_fast
+
+    a = np.array([1.5, np.nan, np.inf, -np.inf, np.inf, 0.0, -0.0])
+    b = np.array([2.0, 1.0, 1.0, -1.0, -np.inf, np.nan, -0.0])
+    out = np.empty_like(a)
+    calculator_fast._numba_add_into(a, b, out)
+    with np.errstate(invalid="ignore"):
+        expected = np.add(a, b)
+    np.testing.assert_array_equal(out, expected)
+    assert np.signbit(out[-1])
+
+    ints = np.array([2**53, -3], dtype=np.int64)
+    int_out = np.empty_like(ints)
+    calculator_fast._numba_add_into(ints, ints, int_out)
+    np.testing.assert_array_equal(int_out, ints + ints)
+
+
 def test_main_function(capsys):
     """Test the main function runs without errors."""
     main()
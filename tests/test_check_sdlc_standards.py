@@ -0,0 +1,239 @@
+"""
+Unit tests for the SDLC standards checker script.
+
+The checker lives in scripts/ rather than a package, so it is loaded by path.
+"""
+
+import importlib.util
+import itertools
+import re
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "check_sdlc_standards.py"
+_spec = importlib.util.spec_from_file_location("check_sdlc_standards", _SCRIPT)
+checker = importlib.util.module_from_spec(_spec)
+# Registered so worker processes can unpickle _check_file by module name
+sys.modules[_spec.name] = checker
+_spec.loader.exec_module(checker)
+
+# Every string of up to three characters drawn from a mix of the relevant classes
+_NAMES = [""] + [
+    "".join(chars)
+    for length in range(1, 4)
+    for chars in itertools.product("aZ_0é", repeat=length)
+]
+
+
+def _check_source(tmp_path, source, name="module.py"):
+    """Write source to a temporary file and run the per-file checks on it."""
+    path = tmp_path / name
+    path.write_text(textwrap.dedent(source), encoding="utf-8")
+    return checker._check_file(str(path))
+
+
+@pytest.mark.parametrize("name", _NAMES)
+def test_name_helpers_match_original_patterns(name):
+    """Test that the str-based name checks accept exactly what the regexes did."""
+    assert checker._is_snake(name) == bool(re.match(r"^[a-z][a-z0-9_]*$", name))
+    assert checker._is_snake(name, allow_leading_underscore=True) == bool(
+        re.match(r"^[a-z_][a-z0-9_]*$", name)
+    )
+    assert checker._is_pascal(name) == bool(re.match(r"^[A-Z][a-zA-Z0-9]*$", name))
+
+
+def test_nested_definitions_are_checked(tmp_path):
+    """Test that definitions inside methods, blocks and async defs are found."""
+    errors, _ = _check_source(
+        tmp_path,
+        '''
+        """Module docstring."""
+        import sys
+
+
+        class Outer:
+            """Class docstring."""
+
+            def method(self):
+                """Method docstring."""
+
+                def InMethod():
+                    """Nested docstring."""
+
+
+        if sys:
+
+            class in_if:
+                """Class docstring."""
+
+
+        async def AsyncFunction():
+            def InAsync():
+                """Nested docstring."""
+
+
+        try:
+            pass
+        except ImportError:
+
+            def InHandler():
+                """Nested docstring."""
+        ''',
+    )
+    assert any("Function 'InMethod'" in error for error in errors)
+    assert any("Class 'in_if'" in error for error in errors)
+    assert any("Function 'InAsync'" in error for error in errors)
+    assert any("Function 'InHandler'" in error for error in errors)
+    # Async functions themselves have never been subject to these checks
+    assert not any("AsyncFunction" in error for error in errors)
+
+
+def test_missing_docstrings_reported_for_public_definitions(tmp_path):
+    """Test that public, but not private, definitions need docstrings."""
+    errors, warnings = _check_source(
+        tmp_path,
+        """
+        def public():
+            pass
+
+
+        def _private():
+            pass
+        """,
+    )
+    assert any("Module" in warning for warning in warnings)
+    assert any("Function 'public'" in error for error in errors)
+    assert not any("_private" in error for error in errors)
+
+
+def test_wildcard_imports_found_in_module_level_blocks(tmp_path):
+    """Test that guarded wildcard imports at module level are reported."""
+    errors, _ = _check_source(
+        tmp_path,
+        '''
+        """Module docstring."""
+        from os import *
+
+        try:
+            from sys import *
+        except ImportError:
+            pass
+
+        if True:
+            from os.path import *
+        else:
+            from json import *
+        ''',
+    )
+    wildcards = [error for error in errors if "Wildcard import" in error]
+    assert len(wildcards) == 4
+    assert any("from os.path import *" in error for error in wildcards)
+
+
+def test_long_files_and_functions_warned(tmp_path):
+    """Test the complexity limits, not counting a trailing newline as a line."""
+    body = "\n".join(["    x = 1"] * 60)
+    source = f'"""Doc."""\ndef long_function():\n    """Doc."""\n{body}\n'
+    source += "\n" * (500 - source.count("\n"))
+    _, warnings = _check_source(tmp_path, source)
+    assert any("Function 'long_function'" in warning for warning in warnings)
+    assert not any("lines (exceeds recommended 500)" in w for w in warnings)
+
+    _, warnings = _check_source(tmp_path, source + "\n")
+    assert any("has 501 lines" in warning for warning in warnings)
+
+
+def test_unparseable_file_reported_once(tmp_path):
+    """Test that a syntax error produces a single warning and no errors."""
+    errors, warnings = _check_source(tmp_path, "def broken(:\n")
+    assert errors == []
+    assert len(warnings) == 1
+    assert warnings[0].startswith("Could not parse")
+
+
+def test_check_all_prunes_excluded_directories(tmp_path):
+    """Test the full run skips excluded trees and flags packages without init."""
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "__init__.py").write_text('"""Package."""\n')
+    (tmp_path / "src" / "pkg" / "BadName.py").write_text('"""Module."""\n')
+    (tmp_path / "venv").mkdir()
+    (tmp_path / "venv" / "BadVenv.py").write_text("def Bad(): pass\n")
+
+    errors, warnings = checker.SDLCChecker(str(tmp_path)).check_all()
+
+    assert len(errors) == 1
+    assert "BadName.py" in errors[0] and "snake_case" in errors[0]
+    assert not any("venv" in message for message in errors + warnings)
+    assert any("missing __init__.py" in warning for warning in warnings)
+
+
+def test_check_all_on_missing_root_reports_missing_src(tmp_path):
+    """Test that a nonexistent root is reported rather than raising."""
+    errors, warnings = checker.SDLCChecker(str(tmp_path / "missing")).check_all()
+    assert errors == ["Missing 'src' directory for source code"]
+    assert warnings == []
+
+
+def test_unreadable_directories_are_skipped(tmp_path, monkeypatch):
+    """Test that directories os.scandir cannot open are skipped, not fatal."""
+    locked = tmp_path / "src" / "locked"
+    locked.mkdir(parents=True)
+    (tmp_path / "src" / "__init__.py").write_text('"""Package."""\n')
+    (locked / "__init__.py").write_text('"""Package."""\n')
+    (locked / "BadName.py").write_text('"""Module."""\n')
+
+    real_scandir = checker.os.scandir
+
+    def scandir(path):
+        """Deny access to the locked directory only."""
+        if str(path) == str(locked):
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(checker.os, "scandir", scandir)
+    errors, warnings = checker.SDLCChecker(str(tmp_path)).check_all()
+    assert errors == []
+    assert warnings == []
+
+
+def _make_project(tmp_path, count):
+    """Create a project whose src/ holds count modules with checker findings."""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "__init__.py").write_text('"""Package."""\n')
+    for i in range(count):
+        (src / f"module_{i}.py").write_text(f"from os import *\ndef Bad{i}(): pass\n")
+    return tmp_path
+
+
+def _check_serially(root):
+    """Run check_all with the pool disabled, for comparison."""
+    sdlc = checker.SDLCChecker(str(root))
+    sdlc.check_file_naming()
+    sdlc.check_module_structure()
+    sdlc._collect(map(checker._check_file, [e.path for e in sdlc._python_files()]))
+    return sdlc.errors, sdlc.warnings
+
+
+def test_process_pool_matches_serial_results(tmp_path):
+    """Test that projects above the parallel threshold give identical results."""
+    root = _make_project(tmp_path, checker._PARALLEL_THRESHOLD + 4)
+    assert checker.SDLCChecker(str(root)).check_all() == _check_serially(root)
+
+
+def test_process_pool_failure_falls_back_to_serial(tmp_path, monkeypatch):
+    """Test that an unavailable process pool degrades to in-process checking."""
+    root = _make_project(tmp_path, checker._PARALLEL_THRESHOLD + 4)
+
+    class UnavailablePool:
+        """Stand-in for ProcessPoolExecutor in a runner that forbids pools."""
+
+        def __init__(self, *args, **kwargs):
+            """Refuse to start, as a sandboxed runner would."""
+            raise OSError("process pools are not permitted here")
+
+    monkeypatch.setattr(checker, "ProcessPoolExecutor", UnavailablePool)
+    assert checker.SDLCChecker(str(root)).check_all() == _check_serially(root)